@@ -76,6 +76,10 @@ class FACSvatarPreferences(AddonPreferences):
                                 description="Port of ZMQ publisher socket",
                                 default="5572",
                                 )
+    feedback_port: StringProperty(name="Feedback port",
+                                  description="Port of the publisher's ZMQ PULL socket receiving Blender's feedback",
+                                  default="5573",
+                                  )
 
     def draw(self, context):
         layout = self.layout
@@ -84,6 +88,7 @@ class FACSvatarPreferences(AddonPreferences):
         row = layout.row(align=True)
         row.prop(self, "socket_ip", text="ip")
         row.prop(self, "socket_port", text="port")
+        row.prop(self, "feedback_port", text="feedback port")
 
 
 # Define Classes to register
@@ -0,0 +1,162 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Copyright (c) Stef van der Struijk <stefstruijk@protonmail.ch>
+
+"""Reference publisher standing in for FACSvatar, using the add-on's feedback for credit-based rate control
+
+Run outside Blender (only needs pyzmq): `python feedback_publisher.py --fps 60`
+Then in Blender tick "Send feedback" and click "Connect socket".
+
+Every feedback report from Blender (applied fps, queue depth, last applied frame) is turned into credits:
+the number of frames Blender is expected to apply before the next report, minus the backlog it already has.
+Sending a frame costs 1 credit; frames produced without credits are dropped here, instead of being serialized,
+sent and dropped in Blender. When reports stop (e.g. Blender is busy rendering), only `target_queue` frames are sent
+per timeout period. If no feedback was ever received (e.g. `Send feedback` off), frames are sent at the full rate.
+"""
+
+import argparse
+import json
+import math
+import time
+
+import zmq
+
+
+class CreditRateControl:
+    """Keeps track of how many frames may be sent, based on feedback reports"""
+
+    def __init__(self, target_queue=2, headroom=1.1, min_timeout=2.0):
+        # backlog we allow in Blender's queue, so it never has to wait for a frame
+        self.target_queue = target_queue
+        # grant slightly more than Blender applied, so the rate can grow back when Blender speeds up
+        self.headroom = headroom
+        # minimum seconds without feedback before granting a trickle of `target_queue` frames;
+        # scaled up with the reported interval, so slow reporting isn't mistaken for missing reports
+        self.min_timeout = min_timeout
+        self.timeout = min_timeout
+
+        self.credits = 0.0
+        # time of the last grant; None until the first feedback report arrives
+        self.grant_time = None
+
+    def update(self, feedback):
+        """Replaces the credits with a new grant based on a feedback report"""
+        expected = feedback['fps_applied'] * feedback['interval'] * self.headroom
+        self.credits = max(0.0, expected + self.target_queue - feedback['queue_depth'])
+        self.grant_time = time.perf_counter()
+        # allow a couple of missed reports before assuming Blender stopped reporting
+        self.timeout = max(self.min_timeout, 3 * feedback['interval'])
+
+    def take(self):
+        """Returns True if a frame may be sent, and uses a credit if so"""
+        # never received feedback; Blender might not be reporting at all
+        if self.grant_time is None:
+            return True
+
+        # reports stopped (e.g. Blender is blocked); keep throttling, but let a few frames through per period
+        now = time.perf_counter()
+        if now - self.grant_time > self.timeout:
+            self.credits = max(self.credits, self.target_queue)
+            self.grant_time = now
+
+        if self.credits >= 1:
+            self.credits -= 1
+            return True
+        return False
+
+
+def make_msg(frame, fps):
+    """Generates FACSvatar-like data: slowly opening/closing mouth and a nodding head"""
+    t = frame / fps
+    data = {
+        'frame': frame,
+        'blendshapes': {
+            'Expressions_mouthOpen_max': 0.5 + 0.5 * math.sin(t * 2 * math.pi * .5),
+            'Expressions_eyeClosedL_max': 0.0,
+            'Expressions_eyeClosedR_max': 0.0,
+        },
+        'pose': {
+            'pose_Rx': 0.2 * math.sin(t * 2 * math.pi * .25),
+            'pose_Ry': 0.0,
+            'pose_Rz': 0.0,
+        },
+    }
+    return [b"facsvatar", str(time.time()).encode('ascii'), json.dumps(data).encode('utf-8')]
+
+
+def main(args):
+    zmq_ctx = zmq.Context().instance()
+
+    # Blender's SUB socket connects to this
+    socket_pub = zmq_ctx.socket(zmq.PUB)
+    socket_pub.bind(f"tcp://*:{args.port}")
+    # Blender's feedback PUSH socket connects to this
+    socket_feedback = zmq_ctx.socket(zmq.PULL)
+    socket_feedback.bind(f"tcp://*:{args.feedback_port}")
+
+    rate_control = CreditRateControl(target_queue=args.target_queue)
+    frames_sent = 0
+    frames_skipped = 0
+    frame = 0
+    next_time = time.perf_counter()
+
+    print(f"Publishing {args.fps} fps on port {args.port}, listening for feedback on port {args.feedback_port}")
+    try:
+        while args.frames <= 0 or frame < args.frames:
+            # process all feedback reports received since the last frame
+            while True:
+                try:
+                    topic, timestamp, feedback = socket_feedback.recv_multipart(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                feedback = json.loads(feedback.decode('utf-8'))
+                rate_control.update(feedback)
+                print(f"Feedback: {feedback}; sent: {frames_sent}; skipped: {frames_skipped}")
+
+            if rate_control.take():
+                socket_pub.send_multipart(make_msg(frame, args.fps))
+                frames_sent += 1
+            else:
+                frames_skipped += 1
+            # frame numbers keep counting while skipping, so key frames stay at their original time
+            frame += 1
+
+            next_time += 1 / args.fps
+            time.sleep(max(0.0, next_time - time.perf_counter()))
+
+        # empty message lets Blender know this was the last message
+        socket_pub.send_multipart([b"facsvatar", str(time.time()).encode('ascii'), b""])
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Sent {frames_sent} frames, skipped {frames_skipped} frames")
+        socket_pub.close(linger=1000)
+        socket_feedback.close(linger=0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", default="5572", help="Port to publish frames on")
+    parser.add_argument("--feedback_port", default="5573", help="Port to receive Blender's feedback on")
+    parser.add_argument("--fps", type=float, default=60, help="Frames per second produced by this stand-in")
+    parser.add_argument("--frames", type=int, default=0, help="Number of frames to produce (0: until Ctrl+C)")
+    parser.add_argument("--target_queue", type=int, default=2,
+                        help="Number of frames allowed to wait in Blender's queue")
+
+    main(parser.parse_args())
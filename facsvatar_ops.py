@@ -24,6 +24,14 @@ import sys
 import subprocess  # use Python executable (for pip usage)
 from pathlib import Path  # Object-oriented filesystem paths since Python 3.4
 import json
+import time
+from collections import deque
+
+
+# with feedback on: maximum number of received, but not yet applied messages (ZeroMQ's default receive high water mark)
+MSG_QUEUE_MAX = 1000
+# with feedback on: receive high water mark of the subscriber socket, so (almost) the whole backlog is in our own queue
+FEEDBACK_RCVHWM = 10
 
 
 class SOCKET_OT_connect_subscriber(bpy.types.Operator):
@@ -59,6 +67,10 @@ class SOCKET_OT_connect_subscriber(bpy.types.Operator):
             self.url = f"tcp://{preferences.socket_ip}:{preferences.socket_port}"
             # store our connection in Blender's WindowManager for access in self.timed_msg_poller()
             bpy.types.WindowManager.socket_sub = self.zmq_ctx.socket(zmq.SUB)
+            # messages are moved to self.msg_queue when feedback is on; keep ZeroMQ's buffer small,
+            # so the reported queue depth is the real backlog (must be set before connecting)
+            if self.socket_settings.send_feedback:
+                bpy.types.WindowManager.socket_sub.setsockopt(zmq.RCVHWM, FEEDBACK_RCVHWM)
             bpy.types.WindowManager.socket_sub.connect(self.url)  # publisher connects to this (subscriber)
             bpy.types.WindowManager.socket_sub.setsockopt(zmq.SUBSCRIBE, ''.encode('ascii'))
             self.report({'INFO'}, "Sub connected to: {}\nWaiting for data...".format(self.url))
@@ -67,6 +79,26 @@ class SOCKET_OT_connect_subscriber(bpy.types.Operator):
             self.poller = zmq.Poller()
             self.poller.register(bpy.types.WindowManager.socket_sub, zmq.POLLIN)
 
+            # received messages waiting to be applied; with feedback on, its length is reported back as queue depth
+            self.msg_queue = deque()
+            # statistics for the feedback reports
+            self.frames_applied = 0
+            self.frame_last = -1
+            self.feedback_time = time.perf_counter()
+
+            # optional feedback socket, so the publisher can adapt its rate to how fast Blender applies frames
+            if self.socket_settings.send_feedback:
+                self.url_feedback = f"tcp://{preferences.socket_ip}:{preferences.feedback_port}"
+                bpy.types.WindowManager.socket_feedback = self.zmq_ctx.socket(zmq.PUSH)
+                # only the newest report is of interest; don't queue reports when the publisher isn't listening
+                bpy.types.WindowManager.socket_feedback.setsockopt(zmq.SNDHWM, 1)
+                bpy.types.WindowManager.socket_feedback.setsockopt(zmq.IMMEDIATE, 1)
+                bpy.types.WindowManager.socket_feedback.setsockopt(zmq.LINGER, 0)
+                bpy.types.WindowManager.socket_feedback.connect(self.url_feedback)  # publisher binds a PULL socket
+                self.report({'INFO'}, "Feedback connected to: {}".format(self.url_feedback))
+            else:
+                bpy.types.WindowManager.socket_feedback = None
+
             # let Blender know our socket is connected
             self.socket_settings.socket_connected = True
 
@@ -94,8 +126,15 @@ class SOCKET_OT_connect_subscriber(bpy.types.Operator):
             except AttributeError:
                 self.report({'INFO'}, "Subscriber was socket not active")
 
+            # feedback socket only exists if `send_feedback` was on while connecting
+            socket_feedback = getattr(bpy.types.WindowManager, "socket_feedback", None)
+            if socket_feedback:
+                socket_feedback.close()
+                self.report({'INFO'}, "Feedback socket closed")
+
             # let Blender know our socket is disconnected
             bpy.types.WindowManager.socket_sub = None
+            bpy.types.WindowManager.socket_feedback = None
             self.socket_settings.socket_connected = False
 
         return {'FINISHED'}  # Lets Blender know the operator finished successfully.
@@ -104,6 +143,7 @@ class SOCKET_OT_connect_subscriber(bpy.types.Operator):
         """Keeps listening to integer values and uses that to move (previously) selected objects"""
 
         socket_sub = bpy.types.WindowManager.socket_sub
+        socket_feedback = getattr(bpy.types.WindowManager, "socket_feedback", None)
 
         # only keep running if socket reference exist (not None)
         if socket_sub:
@@ -111,8 +151,16 @@ class SOCKET_OT_connect_subscriber(bpy.types.Operator):
             sockets = dict(self.poller.poll(0))
             # check if our sub socket has a message
             if socket_sub in sockets:
-                # get the message
-                topic, timestamp, msg = socket_sub.recv_multipart()
+                if socket_feedback:
+                    # move all waiting messages to our own queue, so we know how far we are behind
+                    self.receive_msgs(socket_sub)
+                else:
+                    # get the message
+                    self.msg_queue.append(socket_sub.recv_multipart())
+
+            # apply 1 message per call, in the order they were received
+            if self.msg_queue:
+                topic, timestamp, msg = self.msg_queue.popleft()
                 # print("On topic {}, received data: {}".format(topic, msg))
                 # turn bytes to json string
                 msg = msg.decode('utf-8')
@@ -133,6 +181,8 @@ class SOCKET_OT_connect_subscriber(bpy.types.Operator):
                     # if we only wanted to update the active object with `.objects.active`
                     # self.selected_obj.location.x = move_val
                     # move all (previously) selected objects' x coordinate to move_val
+                    # only count the frame as applied if at least 1 object was actually updated
+                    applied = False
                     for obj in self.selected_objs:
                         # TODO check if FACS compatible model
                         try:
@@ -142,6 +192,7 @@ class SOCKET_OT_connect_subscriber(bpy.types.Operator):
                             if self.socket_settings.facial_configuration and 'blendshapes' in msg and msg['blendshapes']:
                                 # obj[1] == bpy.data.objects['mb_model']
                                 self.set_blendshapes(obj[1], msg['blendshapes'], insert_frame)
+                                applied = True
                             else:
                                 self.report({'INFO'}, "No blendshape data found in received msg")
 
@@ -149,19 +200,67 @@ class SOCKET_OT_connect_subscriber(bpy.types.Operator):
                             if self.socket_settings.rotate_head and 'pose' in msg and msg['pose']:
                                 # obj[1] == bpy.data.objects['mb_model']
                                 self.set_head_neck_pose(obj[1], msg['pose'], insert_frame)
+                                applied = True
                             else:
                                 self.report({'INFO'}, "No pose data found in received msg")
                         except:
                             self.report({'WARNING'}, "Object likely not a support model")
 
+                    if applied:
+                        self.frames_applied += 1
+                        self.frame_last = msg['frame']
+
                 else:
                     self.socket_settings.msg_received = "Last message received."
 
+            # periodically let the publisher know how fast we are applying frames
+            if socket_feedback:
+                self.send_feedback(socket_feedback)
+
             # keep running and check every 0.1 millisecond for new ZeroMQ messages
             return 0.001
 
         # no return stops the timer to this function
 
+    def receive_msgs(self, socket_sub):
+        """Moves messages waiting in the ZeroMQ socket to self.msg_queue without blocking
+
+        Stops once MSG_QUEUE_MAX messages are queued; ZeroMQ then drops new messages beyond FEEDBACK_RCVHWM"""
+        import zmq
+
+        while len(self.msg_queue) < MSG_QUEUE_MAX:
+            try:
+                self.msg_queue.append(socket_sub.recv_multipart(zmq.NOBLOCK))
+            except zmq.Again:
+                break
+
+    def send_feedback(self, socket_feedback):
+        """Sends applied frames per second, queue depth and last applied frame number once every
+        `feedback_interval` seconds"""
+        import zmq
+
+        now = time.perf_counter()
+        elapsed = now - self.feedback_time
+        if elapsed < self.socket_settings.feedback_interval:
+            return
+
+        feedback = {
+            'fps_applied': round(self.frames_applied / elapsed, 2),
+            # local queue only (capped at MSG_QUEUE_MAX); up to FEEDBACK_RCVHWM more may wait inside ZeroMQ
+            'queue_depth': len(self.msg_queue),
+            'frame_last': self.frame_last,
+            'interval': round(elapsed, 3),
+        }
+        try:
+            socket_feedback.send_multipart([b"feedback", str(time.time()).encode('ascii'),
+                                            json.dumps(feedback).encode('utf-8')], zmq.NOBLOCK)
+        # publisher not listening (yet); this report is outdated by the next one anyway
+        except zmq.Again:
+            pass
+
+        self.frames_applied = 0
+        self.feedback_time = now
+
     def set_blendshapes(self, obj, blendshape_data, insert_frame):
         # set all shape keys values
         # bpy.context.scene.objects.active = self.mb_body
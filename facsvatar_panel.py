@@ -53,6 +53,13 @@ class FACSVATAR_PT_zmqConnector(Panel):
             row.prop(preferences, "socket_ip", text="ip")
             row.prop(preferences, "socket_port", text="port")
 
+            # optional feedback channel to let the publisher adapt its frame rate
+            row = layout.row()
+            row.prop(socket_settings, "send_feedback")
+            if socket_settings.send_feedback:
+                row.prop(preferences, "feedback_port", text="feedback port")
+                layout.prop(socket_settings, "feedback_interval")
+
             # whether if previous selection is remembered or always use current selected objects
             layout.prop(socket_settings, "dynamic_object")
             # if our socket hasn't connected yet
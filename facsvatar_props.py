@@ -25,6 +25,7 @@ from bpy.types import (
 from bpy.props import (
         StringProperty,
         BoolProperty,
+        FloatProperty,
         )
 
 
@@ -73,6 +74,19 @@ class FACSvatarProperties(PropertyGroup):
         description="Save the received data as key frames",
         default=False)
 
+    send_feedback: BoolProperty(
+        name="Send feedback",
+        description="Report applied frames per second, queue depth and last applied frame back to the publisher, "
+                    "so it can adapt its sending rate (set before connecting)",
+        default=False)
+
+    feedback_interval: FloatProperty(
+        name="Feedback interval",
+        description="Seconds between two feedback reports",
+        default=0.5,
+        min=0.05,
+        max=10.0)
+
 
 class PIPFACSvatarProperties(PropertyGroup):
     """pip install and pyzmq install Properties"""